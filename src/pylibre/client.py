@@ -1,45 +1,172 @@
-import subprocess
 from pyntelope import Net, Transaction, Action, Authorization, Data, types
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
-from dotenv import load_dotenv
+import logging
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
+import time
 import yaml
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict
+
+try:
+    import ijson
+except ImportError:
+    # Optional: streams large table pages instead of buffering them whole
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional: decodes RPC responses several times faster than stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:
+    # Optional: enables HTTP/2 multiplexing for concurrent read workloads
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean "the RPC request itself failed", whichever transport ran it
+if httpx is not None:
+    REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    REQUEST_ERRORS = (requests.exceptions.RequestException,)
+
+# Strings that should be converted to numeric pyntelope types
+_NUM_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+# Symbols that mark a "1.00000000 USDT"-style string as an asset
+_ASSET_SYMBOLS = frozenset({"USDT", "BTC", "LIBRE"})
+
+# Known token contracts and precisions on Libre
+TOKEN_SPECS: Dict[str, Dict[str, Any]] = {
+    "BTC": {"contract": "btc.libre", "precision": 8},
+    "USDT": {"contract": "usdt.libre", "precision": 8},
+    "LIBRE": {"contract": "eosio.token", "precision": 4}
+}
+
+# Per-symbol Decimal quantizers, computed once instead of per transfer
+_QUANTIZERS = {symbol: Decimal(10) ** -spec["precision"]
+               for symbol, spec in TOKEN_SPECS.items()}
+
+
+# libyaml-backed loader parses 5-10x faster when the C extension is built
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _load_config(config_path, mtime):
+    """Parse a config file once per (path, mtime); edits invalidate naturally."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _parse_response(response):
+    """Decode a JSON RPC response, using orjson on the raw bytes if present."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _CachedNet(Net):
+    """Net whose get_info result is cached between transaction links.
+
+    Every Transaction.link() fetches chain info over HTTP just to read the
+    chain id (a constant) and a TAPOS reference block (which only needs to
+    be recent, not current). Serving get_info from a short cache removes a
+    hidden round-trip from every signed action.
+    """
+
+    INFO_TTL = 30.0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._info = None
+        self._info_at = 0.0
+
+    def get_info(self, *args, **kwargs):
+        now = time.monotonic()
+        if self._info is None or now - self._info_at >= self.INFO_TTL:
+            self._info = super().get_info(*args, **kwargs)
+            self._info_at = now
+        return self._info
+
+    def invalidate(self):
+        self._info = None
+
+
+class _TTLCache:
+    """Tiny bounded TTL cache for read-only RPC results."""
+
+    def __init__(self, maxsize=1024, ttl=0.5):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key, value):
+        if len(self._data) >= self.maxsize:
+            # Drop the oldest insertion; fine for a cache this small
+            self._data.pop(next(iter(self._data)), None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        self._data.clear()
 
 def extract_error_message(error_json):
     """Extract the relevant error message from a JSON error response"""
+    if not isinstance(error_json, dict):
+        return str(error_json)
+
     try:
-        # Handle blockchain error responses
-        if isinstance(error_json, dict):
-            # Check for processed transaction errors
-            processed = error_json.get('processed', {})
-            except_data = processed.get('except', {})
-            stack = except_data.get('stack', [])
-            
-            if stack and isinstance(stack, list):
+        # Check for processed transaction errors, returning on the first hit
+        processed = error_json.get('processed')
+        if processed:
+            except_data = processed.get('except')
+            stack = except_data.get('stack') if except_data else None
+            if isinstance(stack, list):
                 for item in stack:
-                    if item.get('context', {}).get('level') == 'error':
-                        return item.get('data', {}).get('s')
-            
+                    context = item.get('context')
+                    if context and context.get('level') == 'error':
+                        data = item.get('data')
+                        return data.get('s') if data else None
+
             # Check for action trace errors
-            traces = processed.get('action_traces', [])
-            if traces:
-                for trace in traces:
-                    if 'except' in trace:
-                        if 'stack' in trace['except']:
-                            for stack_item in trace['except']['stack']:
-                                if 'data' in stack_item and 's' in stack_item['data']:
-                                    return stack_item['data']['s']
-                        if 'message' in trace['except']:
-                            return trace['except']['message']
-            
-            # Check for simple error message
-            if 'message' in error_json:
-                return error_json['message']
-            
+            for trace in processed.get('action_traces', ()):
+                trace_except = trace.get('except')
+                if trace_except:
+                    for stack_item in trace_except.get('stack', ()):
+                        data = stack_item.get('data')
+                        if data and 's' in data:
+                            return data['s']
+                    if 'message' in trace_except:
+                        return trace_except['message']
+
+        # Check for simple error message
+        if 'message' in error_json:
+            return error_json['message']
+
         return str(error_json)
-    except:
+    except (KeyError, TypeError, AttributeError):
+        # Never swallow KeyboardInterrupt/SystemExit via a bare except
         return str(error_json)
 
 class LibreClient:
@@ -49,23 +176,101 @@ class LibreClient:
         'mainnet': 'https://lb.libre.org'
     }
 
-    def __init__(self, api_url=None, verbose=False, network='testnet', config_path='config/config.yaml'):
+    # Connect/read timeouts for RPC calls so a hung endpoint fails fast
+    # instead of blocking the calling thread indefinitely
+    CONNECT_TIMEOUT = 3.05
+    READ_TIMEOUT = 15
+    # Paginated table fetches return large pages that are slower to serialize
+    TABLE_READ_TIMEOUT = 30
+
+    # Circuit breaker: after this many consecutive failures, fail fast for
+    # the cooldown window instead of paying a full timeout per call
+    CB_FAILURE_THRESHOLD = 5
+    CB_COOLDOWN = 5.0
+
+    def __init__(self, api_url=None, verbose=False, network='testnet', config_path='config/config.yaml',
+                 http2=False, read_cache_ttl=0):
         """Initialize LibreClient with config-based key loading.
-        
+
         Args:
             api_url (str, optional): Override API endpoint URL. If None, uses config-based default
             verbose (bool): Enable verbose logging
             network (str): Network to use ('mainnet' or 'testnet')
             config_path (str): Path to config YAML file
+            http2 (bool): Multiplex RPC calls over one HTTP/2 connection
+                (requires the httpx extra)
+            read_cache_ttl (float): Seconds to serve repeated balance/table
+                reads from a bounded in-process cache. 0 disables caching;
+                bots polling within a block window typically want ~0.5
         """
         self.network = network
-        
+
         # Use provided API URL or load from config
         self.api_url = api_url or self.ENDPOINTS[network]
         self.private_keys = {}
-        self.net = Net(host=self.api_url)
+        self.net = _CachedNet(host=self.api_url)
         self.verbose = verbose
-        
+
+        # Persistent session: keep-alive and pooled connections amortize the
+        # TCP+TLS handshake across RPC calls; transient errors get retried
+        # with exponential backoff. POST must be opted into explicitly —
+        # urllib3 treats it as non-idempotent by default — which is safe
+        # here because this session only carries read RPCs; transactions
+        # are signed and broadcast through pyntelope, never retried.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=5, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=frozenset(["POST"]),
+                              respect_retry_after_header=True)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            # Explicit so multi-MB table pages always come compressed,
+            # independent of urllib3's defaults
+            "Accept-Encoding": "gzip, deflate"
+        })
+
+        # Opt-in HTTP/2 client: one TLS connection, many in-flight requests
+        self._http = None
+        if http2:
+            if httpx is None:
+                raise ImportError("http2=True requires httpx: pip install 'httpx[http2]'")
+            self._http = httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(self.READ_TIMEOUT, connect=self.CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                headers={"Content-Type": "application/json"}
+            )
+
+        # Opt-in cache for hot read-only lookups
+        self._read_cache = _TTLCache(ttl=read_cache_ttl) if read_cache_ttl > 0 else None
+
+        # Circuit-breaker state for the RPC endpoint
+        self._cb = {"state": "closed", "failures": 0, "opened_at": 0.0}
+
+        # Full endpoint URLs, built once instead of per request
+        self._rpc_urls = {}
+
+        # Token stats are near-static; cache them to skip repeat round-trips
+        self._stats_cache = _TTLCache(maxsize=256, ttl=60)
+
+        # O(1) dispatch for action-data conversion; exact-type keys mean
+        # bool (a subclass of int) can never fall into the int handler
+        self._type_dispatch = {
+            str: self._convert_str,
+            bool: lambda v: types.Bool(v),
+            int: lambda v: types.Int64(v),
+            float: lambda v: types.Float64(v),
+            dict: self._convert_container,
+            list: self._convert_container
+        }
+
         # Load keys from config
         self.load_account_keys(config_path)
         
@@ -75,13 +280,17 @@ class LibreClient:
 
     def load_account_keys(self, config_path):
         """Load private keys from config YAML file."""
+        # Skip the file re-read if this config was already parsed
+        if self.private_keys and config_path == getattr(self, '_config_path', None):
+            return
+        self._config_path = config_path
+
         if self.verbose:
             print(f"Loading config from: {config_path}")
-            
+
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
+            config = _load_config(config_path, os.path.getmtime(config_path))
+
             # Get network configuration
             network_config = config.get('networks', {}).get(self.network, {})
             self.private_keys = network_config.get('private_keys', {})
@@ -89,16 +298,75 @@ class LibreClient:
             # Update API URL if not explicitly provided
             if not self.api_url and 'api_url' in network_config:
                 self.api_url = network_config['api_url']
-                self.net = Net(host=self.api_url)
+                self.net = _CachedNet(host=self.api_url)
             
             if self.verbose:
-                print("Loaded private keys for accounts:", list(self.private_keys.keys()))
+                print("Loaded private keys for accounts:", list(self.private_keys))
                 
         except Exception as e:
             if self.verbose:
                 print(f"Error loading config: {str(e)}")
             raise
 
+    def _record_rpc_failure(self, now):
+        """Count a failed RPC; trip the breaker at the threshold."""
+        self._cb["failures"] += 1
+        if self._cb["state"] == "half-open" or self._cb["failures"] >= self.CB_FAILURE_THRESHOLD:
+            self._cb["state"] = "open"
+            self._cb["opened_at"] = now
+
+    def _post(self, path, payload, read_timeout=None, stream=False):
+        """POST a JSON payload to a chain RPC path.
+
+        Uses the HTTP/2 client when enabled; otherwise plain requests with
+        explicit timeouts. Streaming only applies to the requests path.
+
+        A circuit breaker wraps the endpoint: after CB_FAILURE_THRESHOLD
+        consecutive connection/5xx failures, calls fail immediately for
+        CB_COOLDOWN seconds, then a single half-open probe decides whether
+        to close the circuit again.
+        """
+        url = self._rpc_urls.get(path)
+        if url is None:
+            url = self._rpc_urls[path] = f"{self.api_url}{path}"
+
+        now = time.monotonic()
+        if self._cb["state"] == "open":
+            if now - self._cb["opened_at"] < self.CB_COOLDOWN:
+                raise requests.exceptions.ConnectionError(
+                    f"Circuit breaker open for {self.api_url} "
+                    f"(after {self._cb['failures']} consecutive failures)")
+            # Cooldown expired: let one probe through
+            self._cb["state"] = "half-open"
+
+        # Serialize once with orjson when available; both the session and
+        # the HTTP/2 client already carry the JSON content-type header
+        body = orjson.dumps(payload) if orjson is not None else None
+
+        try:
+            if self._http is not None:
+                if body is not None:
+                    response = self._http.post(url, content=body)
+                else:
+                    response = self._http.post(url, json=payload)
+            else:
+                response = self._session.post(
+                    url,
+                    **({"data": body} if body is not None else {"json": payload}),
+                    timeout=(self.CONNECT_TIMEOUT, read_timeout or self.READ_TIMEOUT),
+                    stream=stream
+                )
+        except REQUEST_ERRORS:
+            self._record_rpc_failure(time.monotonic())
+            raise
+
+        if response.status_code >= 500:
+            self._record_rpc_failure(time.monotonic())
+        else:
+            self._cb["state"] = "closed"
+            self._cb["failures"] = 0
+        return response
+
     def format_response(self, success, data=None, error=None):
         """Standardize response format across all methods"""
         response = {"success": success}
@@ -106,10 +374,19 @@ class LibreClient:
             response["data"] = data
         if not success and error is not None:
             if isinstance(error, str):
-                try:
-                    error_obj = json.loads(error)
-                    response["error"] = extract_error_message(error_obj)
-                except:
+                # Only pay for a JSON parse when the text can actually be
+                # JSON; plain error strings skip straight through
+                if error.lstrip()[:1] in ('{', '['):
+                    try:
+                        if orjson is not None:
+                            error_obj = orjson.loads(error)
+                        else:
+                            error_obj = json.loads(error)
+                        response["error"] = extract_error_message(error_obj)
+                    except ValueError:
+                        # Error text is not JSON; pass it through as-is
+                        response["error"] = error
+                else:
                     response["error"] = error
             else:
                 response["error"] = str(error)
@@ -118,38 +395,44 @@ class LibreClient:
     def get_currency_balance(self, account, symbol, contract=None):
         """Get currency balance for an account."""
         try:
-            # Auto-detect contract and precision if not specified
+            token_info = TOKEN_SPECS.get(symbol.upper())
+            precision = token_info["precision"] if token_info else 8
+
+            # Auto-detect contract if not specified
             if contract is None:
-                contract_map = {
-                    "USDT": {"contract": "usdt.libre", "precision": 8},
-                    "BTC": {"contract": "btc.libre", "precision": 8},
-                    "LIBRE": {"contract": "eosio.token", "precision": 4}
-                }
-                token_info = contract_map.get(symbol.upper())
                 if not token_info:
                     raise ValueError(f"Cannot auto-detect contract for symbol: {symbol}. Please specify contract.")
                 contract = token_info["contract"]
-                precision = token_info["precision"]
             
-            if self.verbose:
-                print(f"Using contract: {contract} for symbol: {symbol}")
+            # Lazy %s formatting: nothing is built unless DEBUG is enabled
+            logger.debug("Using contract: %s for symbol: %s", contract, symbol)
+
+            cache_key = ("bal", contract, account, symbol)
+            if self._read_cache is not None:
+                cached = self._read_cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
-            response = requests.post(
-                f"{self.api_url}/v1/chain/get_currency_balance",
-                json={
+            response = self._post(
+                "/v1/chain/get_currency_balance",
+                {
                     "code": contract,
                     "account": account,
                     "symbol": symbol
                 }
             )
             response.raise_for_status()
-            balances = response.json()
-            
+            balances = _parse_response(response)
+
             # Return first balance or zero balance with correct precision
             if balances:
-                return balances[0]
+                balance = balances[0]
             else:
-                return f"0.{'0' * precision} {symbol}"
+                balance = f"0.{'0' * precision} {symbol}"
+
+            if self._read_cache is not None:
+                self._read_cache.set(cache_key, balance)
+            return balance
 
         except Exception as e:
             if self.verbose:
@@ -179,22 +462,70 @@ class LibreClient:
             if key_type:
                 payload["key_type"] = key_type
             
-            if self.verbose:
-                print(f"\nAPI Request to /v1/chain/get_table_rows:")
-                print(f"Payload: {payload}")
+            logger.debug("API request to /v1/chain/get_table_rows: %s", payload)
 
-            response = requests.post(
-                f"{self.api_url}/v1/chain/get_table_rows",
-                json=payload
-            )
-            response.raise_for_status()
-            return {"success": True, "rows": response.json()["rows"]}
+            cache_key = ("rows",) + tuple(sorted(payload.items()))
+            if self._read_cache is not None:
+                cached = self._read_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            response = self._post("/v1/chain/get_table_rows", payload)
+            # Branch on the status instead of raise/catch: error responses
+            # are expected control flow here, not exceptional events
+            if response.status_code >= 400:
+                return self.format_response(False, error=response.text)
+            result = {"success": True, "rows": _parse_response(response)["rows"]}
+
+            if self._read_cache is not None:
+                self._read_cache.set(cache_key, result)
+            return result
             
         except Exception as e:
             if self.verbose:
                 print(f"Error response: {e.response.text if hasattr(e, 'response') else str(e)}")
             return {"success": False, "error": f"Failed to get table rows: {str(e)}"}
 
+    def _sign_and_send(self, transaction, actor):
+        """Link, sign and send a transaction with the actor's stored key.
+
+        Single signing path for execute_action/transfer; pyntelope hashes
+        against the chain id internally, so keeping one flow here is what
+        lets linking state be shared rather than rebuilt per call site.
+        """
+        linked_transaction = transaction.link(net=self.net)
+
+        private_key = self.private_keys.get(actor)
+        if not private_key:
+            raise Exception(f"No private key found for account {actor}")
+
+        signed_transaction = linked_transaction.sign(key=private_key)
+        try:
+            return signed_transaction.send()
+        except Exception:
+            # A send failure may mean our cached chain info went stale
+            if isinstance(self.net, _CachedNet):
+                self.net.invalidate()
+            raise
+
+    def get_table_rows_batch(self, queries, max_workers=16):
+        """Run several get_table_rows queries concurrently.
+
+        Libre's REST endpoints have no true multi-call batching, so this
+        issues the queries in parallel over the session's keep-alive pool,
+        collapsing N serial round-trips into roughly one. Note that public
+        providers may rate-limit per call, so tune max_workers accordingly.
+
+        Args:
+            queries (list[dict]): get_table_rows keyword arguments per query
+            max_workers (int): Maximum concurrent requests
+
+        Returns:
+            list: One get_table_rows result per query, in submission order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda query: self.get_table_rows(**query), queries))
+
     def execute_action(self, contract, action_name, data, actor, permission="active"):
         """Execute a contract action using pyntelope."""
         try:
@@ -215,106 +546,310 @@ class LibreClient:
                 authorization=[auth]
             )
 
-            # Create and link transaction
+            # Sign and send transaction
             transaction = Transaction(actions=[action])
-            linked_transaction = transaction.link(net=self.net)
+            response = self._sign_and_send(transaction, actor)
 
-            # Get private key for actor
-            private_key = self.private_keys.get(actor)
-            if not private_key:
-                raise Exception(f"No private key found for account {actor}")
+            return self.format_response(True, data={
+                "transaction_id": response.get("transaction_id")
+            })
 
-            # Sign and send transaction
-            signed_transaction = linked_transaction.sign(key=private_key)
-            response = signed_transaction.send()
+        except Exception as e:
+            return self.format_response(False, error=str(e))
+
+    def execute_actions(self, actions, max_actions=32):
+        """Pack multiple contract actions into one transaction, signed once.
+
+        Same economics as transfer_many: one TAPOS link, one signature and
+        one network send for the whole bundle, and the chain applies it
+        atomically. All entries must share the same actor since the bundle
+        is signed with a single key.
+
+        Args:
+            actions (list[dict]): Entries with 'contract', 'action_name',
+                'data' and 'actor' keys plus optional 'permission'
+            max_actions (int): Maximum actions per transaction (default: 32)
+
+        Returns:
+            dict: Standard response with the transaction id on success
+        """
+        try:
+            if not actions:
+                return self.format_response(False, error="No actions provided")
+            if len(actions) > max_actions:
+                return self.format_response(False,
+                    error=f"Too many actions in one transaction: {len(actions)} > {max_actions}")
+
+            actor = actions[0].get("actor")
+            built = []
+            for entry in actions:
+                if entry.get("actor") != actor:
+                    return self.format_response(False,
+                        error="All actions in a batch must share the same actor")
+                action_data = [
+                    Data(name=key, value=self._convert_to_pyntelope_type(value))
+                    for key, value in entry["data"].items()
+                ]
+                auth = Authorization(actor=actor,
+                                     permission=entry.get("permission", "active"))
+                built.append(Action(
+                    account=entry["contract"],
+                    name=entry["action_name"],
+                    data=action_data,
+                    authorization=[auth]
+                ))
+
+            transaction = Transaction(actions=built)
+            response = self._sign_and_send(transaction, actor)
+
+            tx_id = response.get("transaction_id")
+            if not tx_id:
+                return self.format_response(False, error="Transaction rejected by the blockchain")
 
             return self.format_response(True, data={
-                "transaction_id": response.get("transaction_id")
+                "transaction_id": tx_id
             })
 
         except Exception as e:
             return self.format_response(False, error=str(e))
 
-    def get_table(self, code, table, scope, index_position="", key_type=""):
-        """Fetch all rows from a smart contract table by paginating through it."""
-        all_rows = []
+    @staticmethod
+    def _stream_table_page(response):
+        """Incrementally parse one get_table_rows page from a streamed response.
+
+        Rows are built one at a time instead of materializing the whole
+        response body plus its parsed form, roughly halving peak memory
+        on 1000-row pages. Returns (rows, more, next_key).
+        """
+        rows = []
+        more = False
+        next_key = ""
+        builder = None
+
+        # Let urllib3 handle gzip before ijson sees the bytes
+        response.raw.decode_content = True
+
+        for prefix, event, value in ijson.parse(response.raw):
+            if prefix.startswith("rows.item"):
+                if builder is None:
+                    builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                if prefix == "rows.item" and event == "end_map":
+                    rows.append(builder.value)
+                    builder = None
+            elif prefix == "more":
+                more = bool(value)
+            elif prefix == "next_key":
+                next_key = value or ""
+
+        return rows, more, next_key
+
+    def iter_table(self, code, table, scope, index_position="", key_type=""):
+        """Yield rows from a smart contract table one page at a time.
+
+        Memory stays bounded by a single 1000-row page no matter how large
+        the table is, so million-row scans can filter or aggregate without
+        ever holding the full table. Pagination is serial because each
+        page's next_key is only known once the previous page arrives.
+        """
         more = True
         next_lower_bound = ""
-        total_rows = 0
-        
-        try:
-            while more:
-                try:
-                    print(f"\rFetching rows... (found {total_rows} so far)", 
-                          end="", flush=True, file=sys.stderr)
-                    
-                    response = requests.post(
-                        f"{self.api_url}/v1/chain/get_table_rows",
-                        json={
-                            "code": code,
-                            "table": table,
-                            "scope": scope,
-                            "limit": 1000,
-                            "lower_bound": next_lower_bound,
-                            "upper_bound": "",
-                            "json": True,
-                            **({"index_position": index_position} if index_position else {}),
-                            **({"key_type": key_type} if key_type else {})
-                        },
-                        timeout=10
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    
+
+        # Build the payload once; only lower_bound changes between pages
+        payload = {
+            "code": code,
+            "table": table,
+            "scope": scope,
+            "limit": 1000,
+            "lower_bound": "",
+            "upper_bound": "",
+            "json": True
+        }
+        if index_position:
+            payload["index_position"] = index_position
+        if key_type:
+            payload["key_type"] = key_type
+
+        while more:
+            try:
+                payload["lower_bound"] = next_lower_bound
+                use_stream = ijson is not None and self._http is None
+                response = self._post(
+                    "/v1/chain/get_table_rows",
+                    payload,
+                    read_timeout=self.TABLE_READ_TIMEOUT,
+                    stream=use_stream
+                )
+                response.raise_for_status()
+
+                if use_stream:
+                    rows, more, next_key = self._stream_table_page(response)
+                else:
+                    result = _parse_response(response)
                     rows = result.get("rows", [])
-                    all_rows.extend(rows)
-                    total_rows += len(rows)
-                    
                     more = result.get("more", False)
-                    if more:
-                        next_lower_bound = result.get("next_key")
-                        if not next_lower_bound:
-                            break
-                        
-                except requests.exceptions.RequestException as e:
-                    print(f"\nError fetching rows: {str(e)}", file=sys.stderr)
-                    raise Exception(f"Failed to get table: {str(e)}")
-                
-            print(f"\nFetched {total_rows} rows total", file=sys.stderr)
+                    next_key = result.get("next_key")
+
+            except REQUEST_ERRORS as e:
+                print(f"\nError fetching rows: {str(e)}", file=sys.stderr)
+                raise Exception(f"Failed to get table: {str(e)}")
+
+            yield from rows
+
+            if more:
+                next_lower_bound = next_key
+                if not next_lower_bound:
+                    break
+
+    def get_table(self, code, table, scope, index_position="", key_type="", shards=1):
+        """Fetch all rows from a smart contract table by paginating through it.
+
+        Thin accumulating wrapper over iter_table; use the generator
+        directly when the table doesn't need to be held in memory at once.
+        For i64-keyed tables, pass shards > 1 to split the keyspace and
+        fetch ranges concurrently via get_table_async (requires the httpx
+        extra; not usable from inside a running event loop).
+        """
+        if shards > 1:
+            return asyncio.run(self.get_table_async(
+                code, table, scope,
+                index_position=index_position,
+                key_type=key_type,
+                shards=shards
+            ))
+        all_rows = []
+
+        # Throttle progress output so huge pulls don't pay a flushed
+        # stderr write per page
+        last_print = 0.0
+
+        try:
+            for row in self.iter_table(code, table, scope,
+                                       index_position=index_position,
+                                       key_type=key_type):
+                all_rows.append(row)
+                now = time.monotonic()
+                if now - last_print > 0.25:
+                    print(f"\rFetching rows... (found {len(all_rows)} so far)",
+                          end="", flush=True, file=sys.stderr)
+                    last_print = now
+
+            print(f"\nFetched {len(all_rows)} rows total", file=sys.stderr)
             return all_rows  # Return rows directly
-            
+
         except KeyboardInterrupt:
-            print(f"\nFetch interrupted. Returning {total_rows} rows that were collected", 
+            print(f"\nFetch interrupted. Returning {len(all_rows)} rows that were collected",
                   file=sys.stderr)
             return all_rows
 
+    async def _fetch_table_range(self, http, payload, lower_bound, upper_bound):
+        """Paginate one [lower_bound, upper_bound] slice of a table."""
+        rows = []
+        next_lower = lower_bound
+        url = f"{self.api_url}/v1/chain/get_table_rows"
+        while True:
+            page = dict(payload, lower_bound=next_lower, upper_bound=upper_bound)
+            if orjson is not None:
+                response = await http.post(
+                    url,
+                    content=orjson.dumps(page),
+                    headers={"Content-Type": "application/json"})
+            else:
+                response = await http.post(url, json=page)
+            response.raise_for_status()
+            result = _parse_response(response)
+
+            rows.extend(result.get("rows", []))
+            if not result.get("more"):
+                break
+            next_lower = result.get("next_key")
+            if not next_lower:
+                break
+        return rows
+
+    async def get_table_async(self, code, table, scope, index_position="",
+                              key_type="", shards=1):
+        """Fetch all rows from a table, overlapping page round-trips.
+
+        With shards > 1 and key_type="i64" the uint64 keyspace is split into
+        even ranges that are paginated concurrently, turning N serial RTTs
+        into roughly N/shards. Requires the httpx extra.
+        """
+        if httpx is None:
+            raise ImportError("get_table_async requires httpx: pip install 'httpx[http2]'")
+
+        payload = {
+            "code": code,
+            "table": table,
+            "scope": scope,
+            "limit": 1000,
+            "json": True
+        }
+        if index_position:
+            payload["index_position"] = index_position
+        if key_type:
+            payload["key_type"] = key_type
+
+        timeout = httpx.Timeout(self.TABLE_READ_TIMEOUT, connect=self.CONNECT_TIMEOUT)
+        limits = httpx.Limits(max_connections=32)
+        async with httpx.AsyncClient(timeout=timeout, limits=limits) as http:
+            if shards > 1 and key_type == "i64":
+                step = 2**64 // shards
+                ranges = [(str(i * step),
+                           str((i + 1) * step - 1 if i < shards - 1 else 2**64 - 1))
+                          for i in range(shards)]
+                results = await asyncio.gather(
+                    *[self._fetch_table_range(http, payload, lo, hi)
+                      for lo, hi in ranges])
+                return [row for shard in results for row in shard]
+
+            return await self._fetch_table_range(http, payload, "", "")
+
+    def _prepare_transfer(self, quantity, contract):
+        """Validate a quantity string and resolve its contract.
+
+        Returns the normalized (quantity, contract) pair; raises ValueError
+        on a malformed quantity or unknown token.
+        """
+        amount, sep, symbol = quantity.strip().partition(' ')
+        if not sep or ' ' in symbol:
+            raise ValueError(f"Invalid quantity format. Expected 'amount SYMBOL' but got: {quantity}")
+
+        # If no contract specified, try to determine from symbol
+        if contract is None and symbol in TOKEN_SPECS:
+            contract = TOKEN_SPECS[symbol]["contract"]
+            # Format amount to correct precision; Decimal avoids the
+            # float round-trip that corrupts 8-decimal amounts
+            try:
+                amount = format(Decimal(amount).quantize(_QUANTIZERS[symbol]), 'f')
+            except InvalidOperation:
+                raise ValueError(f"Invalid amount in quantity: {quantity}")
+            quantity = f"{amount} {symbol}"
+        elif contract is None:
+            raise ValueError(f"No contract specified for token {symbol} and no default contract known.")
+
+        return quantity, contract
+
+    def _build_transfer_action(self, from_account, to_account, quantity, memo, contract):
+        """Build a single signed-once transfer action."""
+        action_data = [
+            Data(name="from", value=types.Name(from_account)),
+            Data(name="to", value=types.Name(to_account)),
+            Data(name="quantity", value=types.Asset(quantity)),
+            Data(name="memo", value=types.String(memo))
+        ]
+        auth = Authorization(actor=from_account, permission="active")
+        return Action(
+            account=contract,
+            name="transfer",
+            data=action_data,
+            authorization=[auth]
+        )
+
     def transfer(self, from_account, to_account, quantity, memo="", contract=None):
         """Execute a transfer action using pyntelope."""
         try:
-            # Parse quantity to get amount and symbol
-            parts = quantity.strip().split(' ')
-            if len_parts := len(parts) != 2:
-                return self.format_response(False, 
-                    error=f"Invalid quantity format. Expected 'amount SYMBOL' but got: {quantity}")
-            
-            amount, symbol = parts
-            
-            # Define token specifications
-            TOKEN_SPECS = {
-                "BTC": {"contract": "btc.libre", "precision": 8},
-                "USDT": {"contract": "usdt.libre", "precision": 8},
-                "LIBRE": {"contract": "eosio.token", "precision": 4}
-            }
-            
-            # If no contract specified, try to determine from symbol
-            if contract is None and symbol in TOKEN_SPECS:
-                contract = TOKEN_SPECS[symbol]["contract"]
-                # Format amount to correct precision
-                amount = f"{float(amount):.{TOKEN_SPECS[symbol]['precision']}f}"
-                quantity = f"{amount} {symbol}"
-            elif contract is None:
-                return self.format_response(False, 
-                    error=f"No contract specified for token {symbol} and no default contract known.")
+            quantity, contract = self._prepare_transfer(quantity, contract)
 
             if self.verbose:
                 print(f"\nTransfer Details:")
@@ -324,39 +859,60 @@ class LibreClient:
                 print(f"Contract: {contract}")
                 print(f"Memo: {memo}")
 
-            # Create transfer data
-            action_data = [
-                Data(name="from", value=types.Name(from_account)),
-                Data(name="to", value=types.Name(to_account)),
-                Data(name="quantity", value=types.Asset(quantity)),
-                Data(name="memo", value=types.String(memo))
-            ]
+            # Sign and send transaction
+            action = self._build_transfer_action(from_account, to_account, quantity, memo, contract)
+            transaction = Transaction(actions=[action])
+            response = self._sign_and_send(transaction, from_account)
 
-            # Create authorization
-            auth = Authorization(actor=from_account, permission="active")
+            # Check if we got a valid transaction ID
+            tx_id = response.get("transaction_id")
+            if not tx_id:
+                return self.format_response(False, error="Transaction rejected by the blockchain")
 
-            # Create action
-            action = Action(
-                account=contract,
-                name="transfer",
-                data=action_data,
-                authorization=[auth]
-            )
+            return self.format_response(True, data={
+                "transaction_id": tx_id
+            })
 
-            # Create and link transaction
-            transaction = Transaction(actions=[action])
-            linked_transaction = transaction.link(net=self.net)
+        except Exception as e:
+            return self.format_response(False, error=str(e))
 
-            # Get private key for from_account
-            private_key = self.private_keys.get(from_account)
-            if not private_key:
-                raise Exception(f"No private key found for account {from_account}")
+    def transfer_many(self, transfers, max_actions=32):
+        """Pack multiple transfers into one transaction and sign it once.
 
-            # Sign and send transaction
-            signed_transaction = linked_transaction.sign(key=private_key)
-            response = signed_transaction.send()
+        N separate transfer calls cost N signatures, N TAPOS links and N
+        network sends; a multi-action transaction pays each of those once.
+        All entries must share the same 'from' account since the bundle is
+        signed with a single key.
+
+        Args:
+            transfers (list[dict]): Entries with 'from', 'to' and 'quantity'
+                keys plus optional 'memo' and 'contract'
+            max_actions (int): Maximum actions per transaction (default: 32)
+
+        Returns:
+            dict: Standard response with the transaction id on success
+        """
+        try:
+            if not transfers:
+                return self.format_response(False, error="No transfers provided")
+            if len(transfers) > max_actions:
+                return self.format_response(False,
+                    error=f"Too many transfers in one transaction: {len(transfers)} > {max_actions}")
+
+            actor = transfers[0].get("from")
+            actions = []
+            for entry in transfers:
+                if entry.get("from") != actor:
+                    return self.format_response(False,
+                        error="All transfers in a batch must share the same 'from' account")
+                quantity, contract = self._prepare_transfer(
+                    entry["quantity"], entry.get("contract"))
+                actions.append(self._build_transfer_action(
+                    actor, entry["to"], quantity, entry.get("memo", ""), contract))
+
+            transaction = Transaction(actions=actions)
+            response = self._sign_and_send(transaction, actor)
 
-            # Check if we got a valid transaction ID
             tx_id = response.get("transaction_id")
             if not tx_id:
                 return self.format_response(False, error="Transaction rejected by the blockchain")
@@ -368,28 +924,69 @@ class LibreClient:
         except Exception as e:
             return self.format_response(False, error=str(e))
 
-    def _convert_to_pyntelope_type(self, value):
-        """Helper method to convert Python values to pyntelope types."""
+    def _convert_str(self, value):
+        if _NUM_RE.fullmatch(value):  # Looks like a number
+            if "." in value:
+                return types.Float64(float(value))
+            return types.Int64(int(value))
+        if " " in value and value.rpartition(" ")[2] in _ASSET_SYMBOLS:  # Looks like an asset
+            return types.Asset(value)
+        return types.String(value)
+
+    def _convert_scalar(self, value):
         if isinstance(value, str):
-            if value.replace(".", "").isdigit():  # Looks like a number
-                if "." in value:
-                    return types.Float64(float(value))
-                return types.Int64(int(value))
-            if " " in value and value.split()[1] in ["USDT", "BTC", "LIBRE"]:  # Looks like an asset
-                return types.Asset(value)
-            return types.String(value)
+            return self._convert_str(value)
+        if isinstance(value, bool):
+            return types.Bool(value)
         if isinstance(value, int):
             return types.Int64(value)
         if isinstance(value, float):
             return types.Float64(value)
-        if isinstance(value, bool):
-            return types.Bool(value)
-        if isinstance(value, dict):
-            return types.Object({k: self._convert_to_pyntelope_type(v) for k, v in value.items()})
-        if isinstance(value, list):
-            return types.Array([self._convert_to_pyntelope_type(v) for v in value])
         return value
 
+    def _convert_container(self, root):
+        """Convert a nested dict/list with an explicit stack.
+
+        Avoids a Python call frame per node and RecursionError on deeply
+        nested action data. Containers are collected parents-first, then
+        built in reverse so every child is converted before its parent.
+        """
+        containers = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                containers.append(node)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                containers.append(node)
+                stack.extend(node)
+
+        converted = {}
+        for node in reversed(containers):
+            if isinstance(node, dict):
+                converted[id(node)] = types.Object({
+                    k: converted[id(v)] if isinstance(v, (dict, list)) else self._convert_scalar(v)
+                    for k, v in node.items()
+                })
+            else:
+                converted[id(node)] = types.Array([
+                    converted[id(v)] if isinstance(v, (dict, list)) else self._convert_scalar(v)
+                    for v in node
+                ])
+        return converted[id(root)]
+
+    def _convert_to_pyntelope_type(self, value):
+        """Helper method to convert Python values to pyntelope types."""
+        handler = self._type_dispatch.get(type(value))
+        if handler is not None:
+            return handler(value)
+
+        # Fall back to isinstance for subclasses of the dispatched types
+        if isinstance(value, (dict, list)):
+            return self._convert_container(value)
+        return self._convert_scalar(value)
+
     def get_currency_stats(self, contract, symbol):
         """Get currency statistics for a token.
         
@@ -400,25 +997,36 @@ class LibreClient:
         Returns:
             dict: Token statistics including supply, max supply, and issuer
         """
+        cached = self._stats_cache.get((contract, symbol))
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.post(
-                f"{self.api_url}/v1/chain/get_currency_stats",
-                json={
+            response = self._post(
+                "/v1/chain/get_currency_stats",
+                {
                     "code": contract,
                     "symbol": symbol
                 }
             )
-            response.raise_for_status()
-            stats = response.json()
-            
+            if response.status_code >= 400:
+                return self.format_response(False, error=response.text)
+            stats = _parse_response(response)
+
             # Return the stats for the symbol or empty dict if not found
-            return stats.get(symbol, {})
+            result = stats.get(symbol, {})
+            self._stats_cache.set((contract, symbol), result)
+            return result
 
         except Exception as e:
             if self.verbose:
                 print(f"Error getting currency stats: {str(e)}")
             return self.format_response(False, error=str(e))
 
+    def refresh_stats(self):
+        """Drop cached get_currency_stats results so the next call refetches."""
+        self._stats_cache.clear()
+
     def push_action(self, contract: str, action: str, data: dict, account: str, permission: str = "active"):
         """Execute any contract action using pyntelope.
         
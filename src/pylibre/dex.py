@@ -1,64 +1,197 @@
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from .client import LibreClient
 from decimal import Decimal, ROUND_DOWN
+from operator import itemgetter
+
+logger = logging.getLogger(__name__)
+
+# Quantizers for every precision the DEX uses, built once so the hot
+# order-formatting path never constructs a Decimal per call
+_QUANT = {
+    4: Decimal("1e-4"),
+    8: Decimal("1e-8"),
+    10: Decimal("1e-10"),
+}
 
 class DexClient:
     def __init__(self, client: LibreClient):
         self.client = client
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _pair(base_symbol, quote_symbol):
+        """Table scope for a trading pair, memoized per (base, quote)."""
+        return f"{base_symbol.lower()}{quote_symbol.lower()}"
+
+    @staticmethod
+    def _build_order_transfer(order_type, quantity, price, quote_symbol, base_symbol):
+        """Compute the transfer quantity and memo that encode one order.
+
+        Returns (quantity_str, memo) ready for the DEX transfer.
+        """
+        # Skip the str round-trip when callers already hand us Decimals
+        quantity_dec = quantity if isinstance(quantity, Decimal) else Decimal(str(quantity))
+        price_dec = price if isinstance(price, Decimal) else Decimal(str(price))
+
+        # Format with correct precision
+        if order_type == 'buy':
+            send_amount = quantity_dec * price_dec
+            send_symbol = quote_symbol
+            precision = 8
+        else:  # sell
+            send_amount = quantity_dec
+            send_symbol = base_symbol
+            precision = 4 if base_symbol == 'LIBRE' else 8
+        send_quantity = format(send_amount.quantize(_QUANT[precision]), 'f')
+
+        # Create the action memo - exact format that works
+        memo = (f"{order_type}:{format(quantity_dec.quantize(_QUANT[4]), 'f')} {base_symbol}"
+                f":{format(price_dec.quantize(_QUANT[10]), 'f')} {quote_symbol}")
+
+        return f"{send_quantity} {send_symbol}", memo
+
     def place_order(self, account, order_type, quantity, price, quote_symbol, base_symbol, contract="dex.libre"):
         """Place an order on the DEX (bid or offer)."""
         try:
-            # Convert inputs to Decimal for precise calculation
-            quantity_dec = Decimal(str(quantity))
-            price_dec = Decimal(str(price))
-
-            # Format with correct precision
-            if order_type == 'buy':
-                send_amount = quantity_dec * price_dec
-                send_symbol = quote_symbol
-                send_quantity = f"{send_amount:.8f}"
-            else:  # sell
-                send_amount = quantity_dec
-                send_symbol = base_symbol
-                precision = 4 if base_symbol == 'LIBRE' else 8
-                send_quantity = f"{send_amount:.{precision}f}"
-
-            # Create the action memo - exact format that works
-            action = f"{order_type}:{quantity_dec:.4f} {base_symbol}:{price_dec:.10f} {quote_symbol}"
-            
-            print(f"Placing {order_type} order: {quantity} {base_symbol} @ {price} {quote_symbol}")
-            
+            send_quantity, memo = self._build_order_transfer(
+                order_type, quantity, price, quote_symbol, base_symbol)
+
+            # Lazy logging: bots placing hundreds of orders/s shouldn't pay
+            # a flushed stdout write per order
+            logger.debug("Placing %s order: %s %s @ %s %s",
+                         order_type, quantity, base_symbol, price, quote_symbol)
+
             result = self.client.transfer(
                 from_account=account,
                 to_account=contract,
-                quantity=f"{send_quantity} {send_symbol}",
-                memo=action
+                quantity=send_quantity,
+                memo=memo
             )
 
             if result.get("success"):
-                print(f"✅ Order placed successfully")
+                logger.debug("Order placed successfully")
             else:
-                print(f"❌ Order failed: {result.get('error', 'Unknown error')}")
-            
+                logger.error("Order failed: %s", result.get("error", "Unknown error"))
+
             return result
-                
+
+        except Exception as e:
+            logger.error("Error placing order: %s", e)
+            return {"success": False, "error": str(e)}
+
+    def bind_pair(self, account, quote_symbol, base_symbol, contract="dex.libre"):
+        """Specialize order placement for one account and trading pair.
+
+        Market-maker loops reprice the same pair thousands of times; the
+        returned (place_buy, place_sell) closures take just (quantity,
+        price), with the account, symbols and contract captured once.
+        The per-pair constants (quantizers, pair scope) are already
+        cached at module level, so this mainly removes per-call argument
+        plumbing from the hot loop.
+
+        Returns:
+            tuple: (place_buy, place_sell) callables
+        """
+        def place_buy(quantity, price):
+            return self.place_order(account, "buy", quantity, price,
+                                    quote_symbol, base_symbol, contract)
+
+        def place_sell(quantity, price):
+            return self.place_order(account, "sell", quantity, price,
+                                    quote_symbol, base_symbol, contract)
+
+        return place_buy, place_sell
+
+    def place_orders(self, account, orders, contract="dex.libre"):
+        """Place several orders for one account in a single transaction.
+
+        Market makers refreshing both sides of the book pay one signature
+        and one broadcast instead of one per level, and the chain applies
+        all the orders atomically.
+
+        Args:
+            account (str): The account placing the orders
+            orders (list[dict]): Entries with 'order_type', 'quantity',
+                'price', 'quote_symbol' and 'base_symbol' keys
+            contract (str): DEX contract name (default: "dex.libre")
+
+        Returns:
+            dict: Standard response with the transaction id on success
+        """
+        try:
+            transfers = []
+            for order in orders:
+                quantity, memo = self._build_order_transfer(
+                    order["order_type"], order["quantity"], order["price"],
+                    order["quote_symbol"], order["base_symbol"])
+                transfers.append({
+                    "from": account,
+                    "to": contract,
+                    "quantity": quantity,
+                    "memo": memo
+                })
+
+            logger.debug("Placing %d orders in one transaction", len(transfers))
+            return self.client.transfer_many(transfers)
+
+        except Exception as e:
+            logger.error("Error placing orders: %s", e)
+            return {"success": False, "error": str(e)}
+
+    def cancel_orders(self, account, order_ids, quote_symbol, base_symbol, contract="dex.libre"):
+        """Cancel several orders for one account in a single transaction.
+
+        Args:
+            account (str): The account cancelling the orders
+            order_ids (list[int]): Identifiers of the orders to cancel
+            quote_symbol (str): Quote token symbol (e.g., USDT)
+            base_symbol (str): Base token symbol (e.g., BTC)
+            contract (str): DEX contract name (default: "dex.libre")
+
+        Returns:
+            dict: Standard response with the transaction id on success
+        """
+        try:
+            pair = self._pair(base_symbol, quote_symbol)
+            actions = [
+                {
+                    "contract": contract,
+                    "action_name": "cancelorder",
+                    "data": {"orderIdentifier": order_id, "pair": pair},
+                    "actor": account
+                }
+                for order_id in order_ids
+            ]
+
+            logger.debug("Cancelling %d orders in one transaction", len(actions))
+            return self.client.execute_actions(actions)
+
         except Exception as e:
-            print(f"❌ Error placing order: {str(e)}")
             return {"success": False, "error": str(e)}
 
     def fetch_order_book(self, quote_symbol: str, base_symbol: str) -> dict:
-        """Fetch the complete order book for a trading pair."""
+        """Fetch the complete order book for a trading pair.
+
+        Returns a dict with "bids" sorted best-first (highest price) and
+        "offers" sorted best-first (lowest price), or None on error.
+        """
         try:
-            pair = f"{base_symbol.lower()}{quote_symbol.lower()}"
-            
-            if self.client.verbose:
-                print(f"Fetching order book for {base_symbol}/{quote_symbol}...")
-            
-            all_rows = []
+            pair = self._pair(base_symbol, quote_symbol)
+
+            logger.debug("Fetching order book for %s/%s...", base_symbol, quote_symbol)
+
+            # Parse each page into compact bid/offer entries as it
+            # arrives instead of accumulating raw rows for a second pass;
+            # peak memory stays at one page of row dicts regardless of
+            # book depth, and each price is cast to float exactly once
+            bids_raw = []
+            offers_raw = []
             more = True
             last_key = ""
-            
+
             while more:
                 response = self.client.get_table_rows(
                     code="dex.libre",
@@ -67,58 +200,55 @@ class DexClient:
                     limit=1000,
                     lower_bound=last_key
                 )
-                
+
                 if not response.get("success", False):
-                    if self.client.verbose:
-                        print(f"❌ Error fetching order book: {response.get('error', 'Unknown error')}")
+                    logger.error("Error fetching order book: %s",
+                                 response.get('error', 'Unknown error'))
                     return None
-                
-                rows = response.get("rows", [])
-                all_rows.extend(rows)
-                
+
+                for row in response.get("rows", []):
+                    try:
+                        # partition stops at the first space and skips the
+                        # throwaway list that split() allocates per row
+                        quantity = row["baseAsset"].partition(" ")[0]
+
+                        order = {
+                            "identifier": int(row["identifier"]),
+                            "account": row["account"],
+                            "price": row["price"],
+                            "quantity": quantity,
+                            "type": row.get("type", "sell")
+                        }
+
+                        if order["type"] == "buy":
+                            bids_raw.append((float(row["price"]), order))
+                        else:
+                            offers_raw.append((float(row["price"]), order))
+                    except (KeyError, ValueError, IndexError) as e:
+                        logger.debug("Skipping malformed order: %s", row)
+                        continue
+
                 more = response.get("more", False)
                 if more:
                     last_key = response.get("next_key", "")
-            
-            # Parse the rows into bids and offers
-            bids = []
-            offers = []
-            
-            for row in all_rows:
-                try:
-                    quantity = row["baseAsset"].split()[0]
-                    
-                    order = {
-                        "identifier": int(row["identifier"]),
-                        "account": row["account"],
-                        "price": row["price"],
-                        "quantity": quantity,
-                        "type": row.get("type", "sell")
-                    }
-                    
-                    if order["type"] == "buy":
-                        bids.append(order)
-                    else:
-                        offers.append(order)
-                except (KeyError, ValueError, IndexError) as e:
-                    if self.client.verbose:
-                        print(f"Warning: Skipping malformed order: {row}")
-                    continue
-            
+
+            # itemgetter keeps sort comparisons on the C fast path
+            bids_raw.sort(key=itemgetter(0), reverse=True)
+            offers_raw.sort(key=itemgetter(0))
+
             return {
-                "bids": bids,
-                "offers": offers
+                "bids": [order for _, order in bids_raw],
+                "offers": [order for _, order in offers_raw]
             }
             
         except Exception as e:
-            if self.client.verbose:
-                print(f"❌ Error in fetch_order_book: {str(e)}")
+            logger.error("Error in fetch_order_book: %s", e)
             return None
 
     def cancel_order(self, account: str, order_id: int, quote_symbol: str, base_symbol: str) -> dict:
         """Cancel an order."""
         try:
-            pair = f"{base_symbol.lower()}{quote_symbol.lower()}"
+            pair = self._pair(base_symbol, quote_symbol)
             
             result = self.client.execute_action(
                 contract="dex.libre",
@@ -145,85 +275,146 @@ class DexClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def cancel_all_orders(self, account, quote_symbol, base_symbol, contract="dex.libre"):
+    def _cancel_one(self, account, order, order_kind, quote_symbol, base_symbol):
+        """Cancel a single order and normalize the outcome for reporting."""
+        try:
+            cancel_result = self.cancel_order(
+                account=account,
+                order_id=order['identifier'],
+                quote_symbol=quote_symbol,
+                base_symbol=base_symbol
+            )
+            success = cancel_result.get("success", False)
+            return {
+                "order_id": order['identifier'],
+                "type": order_kind,
+                "price": order.get('price'),
+                "success": success,
+                "error": cancel_result.get("error") if not success else None
+            }
+        except Exception as e:
+            return {
+                "order_id": order['identifier'],
+                "type": order_kind,
+                "price": order.get('price'),
+                "success": False,
+                "error": str(e)
+            }
+
+    def _fetch_account_orders(self, account, quote_symbol, base_symbol, contract="dex.libre"):
+        """Fetch one account's open orders for a pair, tagged with side.
+
+        Queries the account secondary index so the node returns O(k) rows
+        for the account instead of the whole book; falls back to a full
+        fetch_order_book scan if the indexed query is rejected. Returns a
+        list of (order, side) tuples.
+        """
+        pair = self._pair(base_symbol, quote_symbol)
+        orders = []
+        lower_bound = account
+
+        while True:
+            response = self.client.get_table_rows(
+                code=contract,
+                table="orderbook2",
+                scope=pair,
+                limit=1000,
+                lower_bound=lower_bound,
+                upper_bound=account,
+                index_position="2",
+                key_type="name"
+            )
+
+            if not response.get("success", False):
+                logger.debug("Account-indexed order query failed (%s); "
+                             "falling back to full book scan",
+                             response.get("error"))
+                order_book = self.fetch_order_book(
+                    quote_symbol=quote_symbol, base_symbol=base_symbol)
+                if order_book is None:
+                    return None
+                orders = [(bid, "bid") for bid in order_book["bids"]
+                          if bid["account"] == account]
+                orders += [(offer, "offer") for offer in order_book["offers"]
+                           if offer["account"] == account]
+                return orders
+
+            for row in response.get("rows", []):
+                # The index can over-return at range edges; keep the filter
+                if row.get("account") != account:
+                    continue
+                side = "bid" if row.get("type") == "buy" else "offer"
+                orders.append(({
+                    "identifier": int(row["identifier"]),
+                    "account": row["account"],
+                    "price": row["price"],
+                    "type": row.get("type", "sell")
+                }, side))
+
+            if not response.get("more", False):
+                return orders
+            lower_bound = response.get("next_key", "")
+            if not lower_bound:
+                return orders
+
+    def cancel_all_orders(self, account, quote_symbol, base_symbol, contract="dex.libre", max_workers=8):
         """
         Cancel all orders for a specific trading pair.
 
+        Cancels are packed into multi-action transactions via
+        cancel_orders, so a full book sweep costs one signature and one
+        broadcast per chunk instead of one per order. A rejected bulk
+        chunk falls back to concurrent per-order cancellation so one bad
+        identifier can't block the rest.
+
         Args:
             account (str): The account cancelling the orders
             quote_symbol (str): Quote token symbol (e.g., USDT)
             base_symbol (str): Base token symbol (e.g., BTC)
             contract (str): DEX contract name (default: "dex.libre")
+            max_workers (int): Maximum concurrent cancellations (default: 8)
 
         Returns:
             dict: Summary of cancellation results
         """
-        print(f"\n🔍 Fetching order book for {base_symbol}/{quote_symbol}...")
-        order_book = self.fetch_order_book(quote_symbol=quote_symbol, base_symbol=base_symbol)
+        logger.debug("Fetching open orders for %s on %s/%s...",
+                     account, base_symbol, quote_symbol)
+        my_orders = self._fetch_account_orders(
+            account, quote_symbol, base_symbol, contract=contract)
+        if my_orders is None:
+            return {"success": False, "error": "Failed to fetch open orders"}
 
+        logger.debug("Cancelling %d orders...", len(my_orders))
         results = []
-        
-        # Cancel all bids
-        print("\nProcessing BIDS:")
-        for bid in order_book["bids"]:
-            if bid["account"] == account:
-                print(f"🚫 Cancelling bid order with identifier: {bid['identifier']}")
-                try:
-                    cancel_result = self.cancel_order(
-                        account=account,
-                        order_id=bid['identifier'],
-                        quote_symbol=quote_symbol,
-                        base_symbol=base_symbol
-                    )
-                    success = cancel_result.get("success", False)
-                    results.append({
-                        "order_id": bid['identifier'],
-                        "type": "bid",
-                        "price": bid.get('price'),
-                        "success": success,
-                        "error": cancel_result.get("error") if not success else None
-                    })
-                    print("✅ Bid cancelled" if success else f"❌ Failed to cancel bid: {cancel_result.get('error')}")
-                except Exception as e:
-                    print(f"❌ Error cancelling bid: {str(e)}")
-                    results.append({
-                        "order_id": bid['identifier'],
-                        "type": "bid",
-                        "price": bid.get('price'),
-                        "success": False,
-                        "error": str(e)
-                    })
-
-        # Cancel all offers
-        print("\nProcessing OFFERS:")
-        for offer in order_book["offers"]:
-            if offer["account"] == account:
-                print(f"🚫 Cancelling sell order with identifier: {offer['identifier']}")
-                try:
-                    cancel_result = self.cancel_order(
-                        account=account,
-                        order_id=offer['identifier'],
-                        quote_symbol=quote_symbol,
-                        base_symbol=base_symbol
-                    )
-                    success = cancel_result.get("success", False)
-                    results.append({
-                        "order_id": offer['identifier'],
-                        "type": "offer",
-                        "price": offer.get('price'),
-                        "success": success,
-                        "error": cancel_result.get("error") if not success else None
-                    })
-                    print("✅ Offer cancelled" if success else f"❌ Failed to cancel offer: {cancel_result.get('error')}")
-                except Exception as e:
-                    print(f"❌ Error cancelling offer: {str(e)}")
-                    results.append({
-                        "order_id": offer['identifier'],
-                        "type": "offer",
-                        "price": offer.get('price'),
-                        "success": False,
-                        "error": str(e)
-                    })
+        # Chunk size matches execute_actions' per-transaction action cap
+        for start in range(0, len(my_orders), 32):
+            chunk = my_orders[start:start + 32]
+            bulk = self.cancel_orders(
+                account=account,
+                order_ids=[order['identifier'] for order, _ in chunk],
+                quote_symbol=quote_symbol,
+                base_symbol=base_symbol,
+                contract=contract
+            )
+            if bulk.get("success"):
+                results.extend({
+                    "order_id": order['identifier'],
+                    "type": order_kind,
+                    "price": order.get('price'),
+                    "success": True,
+                    "error": None
+                } for order, order_kind in chunk)
+                continue
+
+            # Bulk transactions are all-or-nothing; retry this chunk
+            # per-order so partial progress is preserved
+            logger.debug("Bulk cancel failed (%s); falling back to per-order",
+                         bulk.get("error"))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results.extend(executor.map(
+                    lambda entry: self._cancel_one(
+                        account, entry[0], entry[1], quote_symbol, base_symbol),
+                    chunk))
 
         # Summarize results
         successful = sum(1 for r in results if r["success"])
@@ -238,11 +429,11 @@ class DexClient:
             "details": results
         }
         
-        print(f"\n📊 Summary: {summary['summary']}")
+        logger.info("Cancel summary: %s", summary['summary'])
         if failed > 0:
-            print("\nFailed orders:")
             for result in results:
                 if not result["success"]:
-                    print(f"- Order {result['order_id']} ({result['type']}): {result['error']}")
-        
+                    logger.error("Order %s (%s) failed to cancel: %s",
+                                 result['order_id'], result['type'], result['error'])
+
         return summary
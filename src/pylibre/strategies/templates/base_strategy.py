@@ -202,7 +202,7 @@ class BaseStrategy(ABC):
         print(f"Raw balance response: {balance}")
         
         if isinstance(balance, str):
-            amount = Decimal(balance.split()[0])
+            amount = Decimal(balance.partition(" ")[0])
             print(f"Parsed balance: {amount} {self.base_symbol}")
             return max(min_order, min(max_order, amount))
         
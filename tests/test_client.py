@@ -1,9 +1,15 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from pylibre import client as client_module
 from pylibre.client import LibreClient
+import io
 import json
 import requests
 
+
+class _RawStream(io.BytesIO):
+    """Byte stream standing in for urllib3's response.raw in tests."""
+
 @pytest.fixture
 def mock_net():
     with patch('pylibre.client.Net') as mock:
@@ -107,11 +113,12 @@ def test_transfer_success(client):
     assert result["success"] is True
     assert result["data"]["transaction_id"] == "test_tx_id"
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_get_currency_balance_success(mock_post):
     client = LibreClient("https://testnet.libre.org")
     mock_response = Mock()
     mock_response.json.return_value = ["1.00000000 USDT"]
+    mock_response.content = b'["1.00000000 USDT"]'
     mock_response.status_code = 200
     mock_post.return_value = mock_response
 
@@ -123,11 +130,12 @@ def test_get_currency_balance_success(mock_post):
 
     assert result == "1.00000000 USDT"
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_get_currency_balance_empty(mock_post):
     client = LibreClient("https://testnet.libre.org")
     mock_response = Mock()
     mock_response.json.return_value = []
+    mock_response.content = b'[]'
     mock_response.status_code = 200
     mock_post.return_value = mock_response
 
@@ -139,13 +147,14 @@ def test_get_currency_balance_empty(mock_post):
 
     assert result == "0.00000000 USDT"
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_get_table_rows_success(mock_post):
     # Mock the response from the API
     mock_response = Mock()
     mock_response.json.return_value = {
         'rows': [{'id': 1, 'data': 'test'}]
     }
+    mock_response.content = json.dumps({'rows': [{'id': 1, 'data': 'test'}]}).encode()
     mock_response.status_code = 200
     mock_post.return_value = mock_response
 
@@ -165,19 +174,26 @@ def test_get_table_rows_success(mock_post):
     assert result['rows'][0]['id'] == 1
     assert result['rows'][0]['data'] == 'test'
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_get_table_pagination(mock_post):
     client = LibreClient("https://testnet.libre.org")
     
-    # Mock multiple responses for pagination
+    # Mock multiple responses for pagination; .raw carries the same bytes
+    # so the test passes whether or not the ijson streaming path is active
+    first_page = {"rows": [{"id": 1}], "more": True, "next_key": "2"}
+    second_page = {"rows": [{"id": 2}], "more": False}
     mock_post.side_effect = [
         Mock(
             status_code=200,
-            json=lambda: {"rows": [{"id": 1}], "more": True, "next_key": "2"}
+            json=lambda: first_page,
+            content=json.dumps(first_page).encode(),
+            raw=_RawStream(json.dumps(first_page).encode())
         ),
         Mock(
             status_code=200,
-            json=lambda: {"rows": [{"id": 2}], "more": False}
+            json=lambda: second_page,
+            content=json.dumps(second_page).encode(),
+            raw=_RawStream(json.dumps(second_page).encode())
         )
     ]
 
@@ -189,4 +205,38 @@ def test_get_table_pagination(mock_post):
 
     assert len(result) == 2
     assert result[0]["id"] == 1
-    assert result[1]["id"] == 2
\ No newline at end of file
+    assert result[1]["id"] == 2
+
+@pytest.mark.skipif(client_module.ijson is None, reason="ijson not installed")
+def test_stream_table_page():
+    payload = {
+        "rows": [{"id": 1, "balance": "1.00000000 USDT", "tags": [1, 2]}, {"id": 2}],
+        "more": True,
+        "next_key": "3"
+    }
+    response = Mock(raw=_RawStream(json.dumps(payload).encode()))
+
+    rows, more, next_key = LibreClient._stream_table_page(response)
+
+    assert rows == payload["rows"]
+    assert more is True
+    assert next_key == "3"
+
+
+def test_transfer_many_success(client):
+    result = client.transfer_many([
+        {"from": "testsender", "to": "receiver1", "quantity": "1.00000000 USDT", "contract": "usdt.libre"},
+        {"from": "testsender", "to": "receiver2", "quantity": "2.00000000 USDT", "contract": "usdt.libre"}
+    ])
+
+    assert result["success"] is True
+    assert result["data"]["transaction_id"] == "test_tx_id"
+
+def test_transfer_many_mixed_senders(client):
+    result = client.transfer_many([
+        {"from": "testsender", "to": "receiver1", "quantity": "1.00000000 USDT", "contract": "usdt.libre"},
+        {"from": "otheraccount", "to": "receiver2", "quantity": "2.00000000 USDT", "contract": "usdt.libre"}
+    ])
+
+    assert result["success"] is False
+    assert "same 'from' account" in result["error"]
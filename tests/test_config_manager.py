@@ -7,7 +7,9 @@ class TestConfigManager(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test configuration."""
-        cls.test_config_path = Path("tests/fixtures/test_config.yaml")
+        # Dedicated path: tests/fixtures/test_config.yaml is a committed
+        # fixture shared by the client tests and must survive teardown
+        cls.test_config_path = Path("tests/fixtures/test_config_manager.yaml")
         cls.test_config_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Sample test configuration matching new structure